@@ -11,14 +11,41 @@ Classes:
     MusicPlayer: Controla a reprodução de músicas, implementando a interface Playable.
 
 Funções:
+    clip_text(text, width): Corta um texto para caber em uma largura de terminal.
+    draw_lines(win, lines, prev_lines): Desenha apenas as linhas que mudaram desde o último quadro.
+    create_windows(stdscr): Cria as janelas da interface de acordo com o tamanho do terminal.
     main(stdscr): Função principal que inicia a interface de terminal usando Curses.
 """
 
+import io
 import os
+import json
 import time
+import threading
+import unicodedata
 import pygame
 import curses
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+
+# Extensões de arquivo reconhecidas como músicas (comparadas em minúsculas).
+AUDIO_EXTENSIONS = {".mp3", ".ogg", ".flac", ".wav"}
+
+# Layout da interface: a lista de músicas começa abaixo do cabeçalho e ocupa
+# todas as linhas até o status, que fica nas três últimas linhas da tela.
+LIST_TOP = 4
+
+# Tamanho mínimo do terminal: cabeçalho, uma linha de lista, separador e status.
+MIN_ROWS = LIST_TOP + 1 + 1 + 3
+MIN_COLS = 20
+
+# Máximo de leituras de pré-carregamento em andamento ao mesmo tempo.
+MAX_PRELOADS = 2
+
+# Evento postado pelo pygame quando a música atual termina.
+MUSIC_END_EVENT = pygame.USEREVENT + 1
 
 
 class Playable(ABC):
@@ -40,16 +67,18 @@ class Playable(ABC):
         pass
 
 
+@dataclass(slots=True)
 class Song:
     """Representa uma música.
 
+    Usa __slots__ para reduzir a memória ocupada por bibliotecas grandes.
+
     Atributos:
         name (str): Nome da música.
         path (str): Caminho do arquivo da música.
     """
-    def __init__(self, name: str, path: str):
-        self.name = name
-        self.path = path
+    name: str
+    path: str
 
 
 class MusicLibrary:
@@ -57,42 +86,152 @@ class MusicLibrary:
 
     Atributos:
         music_dir (str): Diretório onde as músicas estão armazenadas.
-        songs (list): Lista de objetos Song representando as músicas carregadas.
+        cache_path (str): Caminho do índice em JSON com a última varredura do diretório e subdiretórios.
+        names (list): Nomes das músicas carregadas.
+        paths (list): Caminhos dos arquivos, na mesma ordem de names.
+        display_names (list): Nomes das músicas já formatados para a lista da interface.
+        selected_names (list): Os mesmos nomes formatados para a linha do cursor.
 
     Métodos:
         _load_songs(): Carrega músicas do diretório especificado.
+        _stat(path): Executa os.stat() sem propagar erros.
+        _read_cache(): Lê o índice salvo, se ainda for válido.
+        _write_cache(dir_mtimes, entries): Salva o índice da varredura.
         get_songs(): Retorna a lista de músicas carregadas.
     """
     def __init__(self, music_dir="music"):
         self.music_dir = music_dir
-        self.songs = self._load_songs()
+        self.cache_path = os.path.join(music_dir, ".songs_cache.json")
+        # Nomes e caminhos ficam em listas paralelas: o redesenho da interface só
+        # precisa dos nomes e não toca nos caminhos.
+        self.names, self.paths = self._load_songs()
+        self.display_names = [f"  {name}" for name in self.names]
+        self.selected_names = [f"> {name}" for name in self.names]
 
     def _load_songs(self):
         """
-        Carrega músicas do diretório especificado.
+        Carrega músicas do diretório especificado e de seus subdiretórios.
 
-        Se o diretório não existir, ele será criado.
+        Apenas arquivos com extensão em AUDIO_EXTENSIONS são considerados.
+        Se o diretório não existir, ele será criado. Se nenhum diretório mudou desde
+        a última varredura, as músicas são lidas do índice salvo em cache_path.
 
         Retorna:
-            list: Lista de objetos Song representando as músicas carregadas.
+            tuple: Listas (nomes, caminhos) das músicas carregadas.
         """
         if not os.path.exists(self.music_dir):
             os.makedirs(self.music_dir)
 
-        songs = []
-        for file in os.listdir(self.music_dir):
-            if file.endswith(".mp3"):
-                songs.append(Song(file, os.path.join(self.music_dir, file)))
-        return songs
+        cached = self._read_cache()
+        if cached is not None:
+            return cached
+
+        # Cria o arquivo de cache antes de ler o mtime do diretório: criá-lo
+        # depois alteraria o mtime e invalidaria o índice na próxima execução.
+        try:
+            open(self.cache_path, "a").close()
+        except OSError:
+            pass
+
+        names = []
+        paths = []
+        dir_mtimes = {}
+        pending = [self.music_dir]
+        while pending:
+            root = pending.pop()
+            try:
+                # O mtime é lido antes da listagem: uma mudança durante a
+                # varredura invalida o índice na próxima execução.
+                dir_mtimes[root] = os.stat(root).st_mtime_ns
+                with os.scandir(root) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif (entry.is_file(follow_symlinks=False)
+                              and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS):
+                            names.append(entry.name)
+                            paths.append(entry.path)
+            except OSError:
+                # Subdiretórios sem permissão de leitura são ignorados.
+                continue
+
+        # Em discos de rede ou USB cada stat() espera pela mídia; em paralelo,
+        # o tempo total fica próximo da maior latência, e não da soma delas.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            stats = list(executor.map(self._stat, paths))
+
+        # Descarta arquivos removidos entre a listagem e o stat().
+        entries = [[name, path, stat.st_mtime_ns, stat.st_size]
+                   for name, path, stat in zip(names, paths, stats) if stat is not None]
+        names = [entry[0] for entry in entries]
+        paths = [entry[1] for entry in entries]
+
+        self._write_cache(dir_mtimes, entries)
+        return names, paths
+
+    @staticmethod
+    def _stat(path):
+        """
+        Executa os.stat() sem propagar erros.
+
+        Parâmetros:
+            path (str): Caminho do arquivo.
+
+        Retorna:
+            os.stat_result: Resultado do stat, ou None se o arquivo não puder ser lido.
+        """
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def _read_cache(self):
+        """
+        Lê o índice salvo, se nenhum diretório foi alterado desde que ele foi gerado.
+
+        Custa um stat() por diretório, em vez da listagem de todos os arquivos.
+
+        Retorna:
+            tuple: Listas (nomes, caminhos), ou None se o índice não existir ou estiver desatualizado.
+        """
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache["extensions"] != sorted(AUDIO_EXTENSIONS):
+                return None
+            for path, mtime in cache["dirs"].items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return None
+            names = [name for name, _path, _mtime, _size in cache["songs"]]
+            paths = [path for _name, path, _mtime, _size in cache["songs"]]
+            return names, paths
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def _write_cache(self, dir_mtimes, entries):
+        """
+        Salva o índice da varredura do diretório.
+
+        Falhas de escrita (por exemplo, em uma mídia somente leitura) são ignoradas.
+
+        Parâmetros:
+            dir_mtimes (dict): mtime, em nanossegundos, de cada diretório varrido.
+            entries (list): Listas [nome, caminho, mtime, tamanho] de cada música.
+        """
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"dirs": dir_mtimes, "extensions": sorted(AUDIO_EXTENSIONS), "songs": entries}, f)
+        except OSError:
+            pass
 
     def get_songs(self):
         """
         Retorna a lista de músicas carregadas.
 
         Retorna:
-            list: Lista de objetos Song.
+            list: Lista de objetos Song, montada a partir de names e paths.
         """
-        return self.songs
+        return [Song(name, path) for name, path in zip(self.names, self.paths)]
 
 
 class MusicPlayer(Playable):
@@ -103,8 +242,8 @@ class MusicPlayer(Playable):
         current_index (int): Índice da música atual na lista de reprodução.
         playing (bool): Indica se uma música está sendo reproduzida no momento.
         volume (float): Volume atual da reprodução (0.0 a 1.0).
-        start_time (float): Tempo em que a música atual começou a tocar.
-        elapsed_time (float): Tempo total decorrido desde o início da reprodução.
+        volume_bar (str): Barra de volume pronta para exibição, atualizada em change_volume().
+        error (str): Mensagem da última falha ao carregar uma música, ou None.
 
     Métodos:
         play(index=None): Reproduz a música no índice especificado.
@@ -115,67 +254,194 @@ class MusicPlayer(Playable):
         change_volume(increase=True): Ajusta o volume da reprodução.
         get_elapsed_time(): Retorna o tempo decorrido desde o início da reprodução.
         format_time(seconds): Formata o tempo em minutos e segundos.
+        _ensure_mixer(): Inicializa o mixer do pygame na primeira reprodução.
+        _goto(delta): Move a música atual delta posições na lista e a reproduz.
+        _preload_neighbors(): Carrega em segundo plano a música anterior e a próxima.
+        _start_preloads(): Inicia a leitura das vizinhas que ainda faltam no cache.
+        _preload(index): Lê o arquivo de uma música para a memória.
     """
     def __init__(self):
-        pygame.mixer.init()
         self.library = MusicLibrary()
         self.current_index = 0
         self.playing = False
         self.volume = 0.5
-        self.start_time = None
-        self.elapsed_time = 0
+        self._fmt_cache = (-1, "")
+        self._bars = ['█' * i + ' ' * (10 - i) for i in range(11)]
+        self.volume_bar = self._bars[round(self.volume * 10)]
+        self._preloaded = {}
+        self._preload_wanted = set()
+        self._preloading = set()
+        self._preload_failed = set()
+        self._preload_lock = threading.Lock()
+        self._loaded_path = None
+        self.error = None
+
+    def _ensure_mixer(self):
+        """
+        Inicializa o mixer do pygame na primeira reprodução.
+
+        Usa um buffer menor que o padrão (4096) para reduzir a latência de pausa e retomada.
+        """
+        if pygame.mixer.get_init():
+            return
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
+        # O pygame só posta eventos com o subsistema de vídeo ativo; o driver
+        # "dummy" evita exigir um servidor gráfico em um player de terminal.
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
 
     def play(self, index=None):
         """
         Reproduz a música no índice especificado.
 
+        Se a música já estiver carregada no mixer, ela não é lida de novo. Se o arquivo
+        já foi pré-carregado em memória, ele é usado no lugar do disco.
+
+        Se a música não puder ser carregada, a mensagem fica em error.
+
         Parâmetros:
             index (int, opcional): Índice da música a ser reproduzida. Se None, reproduz a música atual.
+
+        Retorna:
+            bool: True se a música começou a tocar.
         """
         if index is not None:
             self.current_index = index
 
-        if self.library.songs:
-            song = self.library.songs[self.current_index]
+        started = False
+        if self.library.paths:
+            self._ensure_mixer()
+            path = self.library.paths[self.current_index]
             try:
-                pygame.mixer.music.load(song.path)
+                # Se a música já está carregada, play() apenas a reinicia do começo.
+                if path != self._loaded_path:
+                    data = self._preloaded.get(self.current_index)
+                    if data is not None:
+                        pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(path)[1][1:])
+                    else:
+                        pygame.mixer.music.load(path)
+                    self._loaded_path = path
                 pygame.mixer.music.set_volume(self.volume)
                 pygame.mixer.music.play()
-                self.start_time = time.time()
                 self.playing = True
+                self.error = None
+                started = True
             except pygame.error as e:
-                print(f"Erro ao carregar a música: {e}")
+                # Um load() que falha não interrompe a música anterior: ela é
+                # parada aqui para que o mixer fique de acordo com playing.
+                pygame.mixer.music.stop()
+                self._loaded_path = None
+                self.playing = False
+                self.error = f"Erro ao carregar {self.library.names[self.current_index]}: {e}"
+            self._preload_neighbors()
+        return started
+
+    def _preload_neighbors(self):
+        """
+        Carrega em segundo plano a música anterior e a próxima à atual.
+
+        O cache guarda no máximo três músicas: as duas vizinhas e a atual, que vira
+        a anterior ao avançar sem precisar ser lida de novo. As demais são descartadas.
+        """
+        n = len(self.library.paths)
+        wanted = {(self.current_index + 1) % n, (self.current_index - 1) % n}
+        wanted.discard(self.current_index)
+        keep = wanted | {self.current_index}
+
+        with self._preload_lock:
+            self._preload_wanted = wanted
+            for i in list(self._preloaded):
+                if i not in keep:
+                    del self._preloaded[i]
+            self._preload_failed &= wanted
+            self._start_preloads()
+
+    def _start_preloads(self):
+        """
+        Inicia a leitura das vizinhas que ainda faltam no cache.
+
+        No máximo MAX_PRELOADS leituras ficam em andamento; quando uma termina,
+        _preload() chama este método de novo para ocupar a vaga. Deve ser chamado
+        com _preload_lock adquirido.
+        """
+        for i in self._preload_wanted:
+            if i in self._preloaded or i in self._preloading or i in self._preload_failed:
+                continue
+            if len(self._preloading) >= MAX_PRELOADS:
+                break
+            self._preloading.add(i)
+            threading.Thread(target=self._preload, args=(i,), daemon=True).start()
+
+    def _preload(self, index):
+        """
+        Lê o arquivo de uma música para a memória.
+
+        Executado em uma thread separada, para que a leitura do disco não trave a interface.
+        Ao terminar, libera a vaga para a próxima vizinha que ainda falta.
+
+        Parâmetros:
+            index (int): Índice da música a ser pré-carregada.
+        """
+        try:
+            with open(self.library.paths[index], "rb") as f:
+                data = f.read()
+        except OSError:
+            data = None
+
+        with self._preload_lock:
+            self._preloading.discard(index)
+            if data is None:
+                # Não tenta de novo enquanto a música continuar vizinha da atual.
+                self._preload_failed.add(index)
+            elif index in self._preload_wanted:
+                # A música atual pode ter mudado durante a leitura.
+                self._preloaded[index] = data
+            self._start_preloads()
 
     def pause(self):
         """Pausa ou retoma a reprodução da música."""
         if self.playing:
             pygame.mixer.music.pause()
-            self.elapsed_time += time.time() - self.start_time
-            self.start_time = None
             self.playing = False
         else:
             pygame.mixer.music.unpause()
-            self.start_time = time.time()
             self.playing = True
 
     def stop(self):
         """Para a reprodução da música."""
         pygame.mixer.music.stop()
-        self.elapsed_time = 0
-        self.start_time = None
         self.playing = False
 
+    def _goto(self, delta):
+        """
+        Move a música atual delta posições na lista, de forma circular, e a reproduz.
+
+        Músicas que não podem ser carregadas são puladas, até no máximo uma volta
+        completa na lista; a primeira falha continua em error. Não chama stop():
+        play() já recarrega e reinicia a reprodução.
+
+        Parâmetros:
+            delta (int): Quantidade de posições a avançar (negativa para voltar).
+        """
+        n = len(self.library.paths)
+        if not n:
+            return
+        first_error = None
+        for _ in range(n):
+            self.current_index = (self.current_index + delta) % n
+            if self.play():
+                break
+            first_error = first_error or self.error
+        self.error = first_error
+
     def next_song(self):
         """Avança para a próxima música na lista."""
-        self.stop()
-        self.current_index = (self.current_index + 1) % len(self.library.songs)
-        self.play()
+        self._goto(1)
 
     def previous_song(self):
         """Volta para a música anterior na lista."""
-        self.stop()
-        self.current_index = (self.current_index - 1) % len(self.library.songs)
-        self.play()
+        self._goto(-1)
 
     def change_volume(self, increase=True):
         """
@@ -185,96 +451,286 @@ class MusicPlayer(Playable):
             increase (bool): Se True, aumenta o volume. Se False, diminui o volume.
         """
         self.volume = min(1.0, self.volume + 0.1) if increase else max(0.0, self.volume - 0.1)
-        pygame.mixer.music.set_volume(self.volume)
+        # Sem mixer ainda, o volume é aplicado na próxima chamada de play().
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(self.volume)
+        self.volume_bar = self._bars[round(self.volume * 10)]
 
     def get_elapsed_time(self):
         """
         Retorna o tempo decorrido desde o início da reprodução.
 
+        A posição vem do próprio pygame, que já desconta o tempo em pausa.
+
         Retorna:
-            float: Tempo decorrido em segundos.
+            float: Tempo decorrido em segundos (0.0 se nada estiver tocando).
         """
-        if self.start_time is None:
-            return self.elapsed_time
-        return self.elapsed_time + (time.time() - self.start_time if self.playing else 0)
+        pos = pygame.mixer.music.get_pos()
+        return pos / 1000.0 if pos >= 0 else 0.0
 
-    @staticmethod
-    def format_time(seconds):
+    def format_time(self, seconds):
         """
         Formata o tempo em minutos e segundos.
 
+        O último segundo formatado é guardado, já que o valor só muda uma vez por segundo.
+
         Parâmetros:
             seconds (float): Tempo em segundos.
 
         Retorna:
             str: Tempo formatado no formato MM:SS.
         """
-        return time.strftime('%M:%S', time.gmtime(seconds))
+        s = int(seconds)
+        if s == self._fmt_cache[0]:
+            return self._fmt_cache[1]
+        out = f"{s // 60:02d}:{s % 60:02d}"
+        self._fmt_cache = (s, out)
+        return out
+
+
+def clip_text(text, width):
+    """
+    Corta um texto para caber em uma largura, medida em colunas do terminal.
+
+    Caracteres largos (CJK, emoji) ocupam duas colunas e caracteres combinantes
+    nenhuma, por isso o corte não pode ser feito pelo número de caracteres.
+
+    Parâmetros:
+        text (str): Texto a ser cortado.
+        width (int): Número máximo de colunas.
+
+    Retorna:
+        str: O maior prefixo de text que cabe em width colunas.
+    """
+    if len(text) <= width and text.isascii():
+        return text
+
+    used = 0
+    for i, char in enumerate(text):
+        if unicodedata.combining(char):
+            char_width = 0
+        elif unicodedata.east_asian_width(char) in ("W", "F"):
+            char_width = 2
+        else:
+            char_width = 1
+        if used + char_width > width:
+            return text[:i]
+        used += char_width
+    return text
+
+
+def draw_lines(win, lines, prev_lines):
+    """
+    Desenha na janela apenas as linhas que mudaram desde o último quadro.
+
+    Os textos são cortados na largura da janela, em colunas do terminal, para que
+    nomes longos não passem da borda nem quebrem para a linha seguinte. A janela
+    não é atualizada na tela; cabe a quem chama usar noutrefresh() e
+    curses.doupdate().
+
+    Parâmetros:
+        win: Janela (ou pad) do Curses onde as linhas são desenhadas.
+        lines (list): Linhas desejadas como tuplas (y, texto, atributo).
+        prev_lines (list): Linhas desenhadas no quadro anterior.
+
+    Retorna:
+        list: As linhas desenhadas, para serem comparadas no próximo quadro.
+    """
+    if len(lines) != len(prev_lines):
+        # O layout mudou: limpa o buffer e redesenha tudo.
+        win.erase()
+        prev_lines = []
+
+    _, width = win.getmaxyx()
+    for i, line in enumerate(lines):
+        if i < len(prev_lines) and prev_lines[i] == line:
+            continue
+        y, text, attr = line
+        win.move(y, 0)
+        win.clrtoeol()
+        try:
+            win.addstr(y, 2, clip_text(text, width - 3), attr)
+        except curses.error:
+            # Larguras que o terminal calcula diferente de clip_text() ainda
+            # podem estourar a última coluna; a linha fica como está.
+            pass
+
+    return lines
+
+
+def create_windows(stdscr):
+    """
+    Cria as janelas da interface de acordo com o tamanho atual do terminal.
+
+    Chamada no início e a cada redimensionamento. O cabeçalho, que não muda, já
+    é desenhado aqui.
+
+    Parâmetros:
+        stdscr: Objeto de tela do Curses.
+
+    Retorna:
+        tuple: Janelas (cabeçalho, lista, status), ou None se o terminal for pequeno demais.
+    """
+    rows, cols = stdscr.getmaxyx()
+    stdscr.erase()
+    stdscr.leaveok(True)
+
+    if rows < MIN_ROWS or cols < MIN_COLS:
+        stdscr.addstr(0, 0, clip_text("Terminal muito pequeno!", cols - 1))
+        stdscr.noutrefresh()
+        return None
+
+    list_height = rows - 8
+    header_win = curses.newwin(LIST_TOP - 1, cols, 0, 0)
+    list_win = curses.newwin(list_height, cols, LIST_TOP, 0)
+    status_win = curses.newwin(3, cols, LIST_TOP + list_height + 1, 0)
+
+    # Com o cursor oculto, não há por que o curses reposicioná-lo ao fim de
+    # cada doupdate(): leaveok() elimina essas sequências de escape.
+    for win in (header_win, list_win, status_win):
+        win.leaveok(True)
+
+    # O stdscr também é sincronizado aqui para que getch() não o redesenhe
+    # por cima das janelas.
+    draw_lines(header_win, [
+        (0, "🎵 CLI Music Player 🎵", curses.A_BOLD),
+        (2, "Use ↑/↓ para navegar | Enter para tocar | Espaço para pausar | q para sair", curses.A_NORMAL),
+    ], [])
+    stdscr.noutrefresh()
+    header_win.noutrefresh()
+    return header_win, list_win, status_win
 
 
 def main(stdscr):
     """
     Função principal que inicia a interface de terminal usando Curses.
 
+    A tela é dividida em três janelas: o cabeçalho (estático), a lista de músicas
+    (redesenhada apenas quando o cursor se move, e só com as músicas visíveis) e
+    o status do player.
+
     Parâmetros:
         stdscr: Objeto de tela do Curses para manipulação da interface.
     """
     player = MusicPlayer()
 
-    if not player.library.songs:
-        stdscr.addstr(0, 0, "Nenhuma música encontrada! Adicione arquivos MP3 na pasta 'music'.")
+    if not player.library.names:
+        _, cols = stdscr.getmaxyx()
+        message = "Nenhuma música encontrada! Adicione arquivos MP3, OGG, FLAC ou WAV na pasta 'music'."
+        stdscr.addstr(0, 0, clip_text(message, cols - 1))
         stdscr.refresh()
         time.sleep(3)
         return
 
     curses.curs_set(0)
     stdscr.nodelay(True)
-    stdscr.timeout(100)
-    
+    stdscr.timeout(250)
+
+    windows = create_windows(stdscr)
+
     index = 0
+
+    # Tabela de teclas: cada ação retorna True quando o player deve ser encerrado.
+    def quit_player():
+        player.stop()
+        return True
+
+    def cursor_up():
+        nonlocal index
+        if index > 0:
+            index -= 1
+
+    def cursor_down():
+        nonlocal index
+        if index < len(player.library.names) - 1:
+            index += 1
+
+    handlers = {
+        ord('q'): quit_player,
+        curses.KEY_UP: cursor_up,
+        curses.KEY_DOWN: cursor_down,
+        ord('\n'): lambda: player.play(index),  # Enter
+        ord(' '): player.pause,  # Espaço
+        ord('+'): lambda: player.change_volume(True),
+        ord('-'): lambda: player.change_volume(False),
+        curses.KEY_RIGHT: player.next_song,  # >
+        curses.KEY_LEFT: player.previous_song,  # <
+    }
+
     player.play(index)
+    list_lines = []
+    status_lines = []
+    drawn_index = None
 
-    while True:
-        stdscr.clear()
-        stdscr.addstr(0, 2, "🎵 CLI Music Player 🎵", curses.A_BOLD)
-        stdscr.addstr(2, 2, "Use ↑/↓ para navegar | Enter para tocar | Espaço para pausar | q para sair")
-
-        # Lista de músicas
-        for i, song in enumerate(player.library.get_songs()):
-            if i == index:
-                stdscr.addstr(4 + i, 2, f"> {song.name}", curses.A_REVERSE)
-            else:
-                stdscr.addstr(4 + i, 2, f"  {song.name}")
-
-        # Informações do player
-        elapsed = player.format_time(player.get_elapsed_time())
-        stdscr.addstr(15, 2, f"Status: {'▶ Tocando' if player.playing else '⏸ Pausado'}")
-        stdscr.addstr(16, 2, f"Volume: {'█' * int(player.volume * 10)}")
-        stdscr.addstr(17, 2, f"Tempo: {elapsed}")
+    need_redraw = True
+    last_elapsed_int = -1
+    # A posição é lida uma única vez por iteração e reaproveitada no redesenho.
+    elapsed_seconds = player.get_elapsed_time()
 
-        stdscr.refresh()
+    while True:
+        # Só redesenha quando algo mudou: tecla pressionada, troca automática de
+        # música ou virada de segundo.
+        if need_redraw and windows:
+            _, list_win, status_win = windows
+            list_height, _ = list_win.getmaxyx()
+
+            # Lista de músicas
+            if index != drawn_index:
+                # Só as músicas visíveis são desenhadas, com o cursor centralizado.
+                names = player.library.display_names
+                selected = player.library.selected_names
+                first = max(0, min(index - list_height // 2, len(names) - list_height))
+                lines = []
+                for i in range(first, min(first + list_height, len(names))):
+                    if i == index:
+                        lines.append((i - first, selected[i], curses.A_REVERSE))
+                    else:
+                        lines.append((i - first, names[i], curses.A_NORMAL))
+                list_lines = draw_lines(list_win, lines, list_lines)
+                list_win.noutrefresh()
+                drawn_index = index
+
+            # Informações do player
+            last_elapsed_int = int(elapsed_seconds)
+            elapsed = player.format_time(elapsed_seconds)
+            lines = [
+                (0, f"Status: {'▶ Tocando' if player.playing else '⏸ Pausado'}"
+                    + (f" | {player.error}" if player.error else ""), curses.A_NORMAL),
+                (1, f"Volume: {player.volume_bar}", curses.A_NORMAL),
+                (2, f"Tempo: {elapsed}", curses.A_NORMAL),
+            ]
+            if lines != status_lines:
+                status_lines = draw_lines(status_win, lines, status_lines)
+                status_win.noutrefresh()
+
+        if need_redraw:
+            curses.doupdate()
 
         key = stdscr.getch()
 
-        if key == ord('q'):
-            player.stop()
+        if key == curses.KEY_RESIZE:
+            # As janelas são recriadas no novo tamanho e redesenhadas do zero.
+            windows = create_windows(stdscr)
+            list_lines = []
+            status_lines = []
+            drawn_index = None
+            need_redraw = True
+            continue
+
+        handler = handlers.get(key)
+        if handler and handler():
             break
-        elif key == curses.KEY_UP and index > 0:
-            index -= 1
-        elif key == curses.KEY_DOWN and index < len(player.library.songs) - 1:
-            index += 1
-        elif key == ord('\n'):  # Enter
-            player.play(index)
-        elif key == ord(' '):  # Espaço
-            player.pause()
-        elif key == ord('+'):
-            player.change_volume(True)
-        elif key == ord('-'):
-            player.change_volume(False)
-        elif key == curses.KEY_RIGHT: # >
-            player.next_song()
-        elif key == curses.KEY_LEFT: # <
-            player.previous_song()
+
+        # O evento de fim também é postado quando stop() interrompe a música,
+        # então só avança se a música estava tocando e de fato terminou.
+        advanced = False
+        for event in pygame.event.get():
+            if event.type == MUSIC_END_EVENT and player.playing and not pygame.mixer.music.get_busy():
+                player.next_song()
+                advanced = True
+
+        elapsed_seconds = player.get_elapsed_time()
+        need_redraw = key != -1 or advanced or int(elapsed_seconds) != last_elapsed_int
 
 
 if __name__ == "__main__":